@@ -141,7 +141,7 @@ class ConfusionMatrix(AbstractPlot):
     @classmethod
     @modify_exceptions
     def from_raw_data(
-        cls, y_true, y_pred, target_names=None, normalize=False, cmap=None
+        cls, y_true, y_pred, target_names=None, normalize=False, cmap=None, ax=None
     ):
         """
 
@@ -154,7 +154,29 @@ class ConfusionMatrix(AbstractPlot):
             y_true, y_pred, target_names, cmap=cmap
         )
         cm = _confusion_matrix(y_true, y_pred, normalize)
-        return cls(cm, target_names=target_names, normalize=normalize, cmap=cmap).plot()
+        return cls(
+            cm, target_names=target_names, normalize=normalize, cmap=cmap
+        ).plot(ax=ax)
+
+    @classmethod
+    def _from_encoded(cls, y_true_codes, y_pred_codes, classes, normalize=False):
+        """
+        Build a confusion matrix (without plotting it) from labels encoded as
+        indices into ``classes``, e.g. with
+        ``np.unique(..., return_inverse=True)``. Skips the label discovery
+        done by ``from_raw_data``
+        """
+        n_classes = len(classes)
+        cm = np.bincount(
+            n_classes * np.asarray(y_true_codes) + np.asarray(y_pred_codes),
+            minlength=n_classes * n_classes,
+        ).reshape(n_classes, n_classes)
+
+        if normalize:
+            cm = _normalize_confusion_matrix(cm)
+
+        target_names = ["Class {}".format(v) for v in classes]
+        return cls(cm, target_names=target_names, normalize=normalize)
 
     @classmethod
     def _from_data(cls, target_names, normalize, cm):
@@ -169,8 +191,16 @@ def _confusion_matrix(y_true, y_pred, normalize):
     cm = sk_confusion_matrix(y_true, y_pred)
 
     if normalize:
-        cm = cm.astype("float") / cm.sum(axis=1)[:, np.newaxis]
+        cm = _normalize_confusion_matrix(cm)
+
+    return cm
+
 
+def _normalize_confusion_matrix(cm):
+    # rows without samples are left as zeros, normalize in place
+    cm = cm.astype(np.float64)
+    row_sums = cm.sum(axis=1, keepdims=True)
+    np.divide(cm, np.where(row_sums == 0, 1, row_sums), out=cm)
     return cm
 
 
@@ -221,6 +251,7 @@ def confusion_matrix(
         target_names=target_names,
         normalize=normalize,
         cmap=cmap,
+        ax=ax,
     ).ax_
 
 
@@ -15,6 +15,7 @@ from sklearn.metrics import confusion_matrix as sk_confusion_matrix
 from sklearn_evaluation import __version__
 from sklearn_evaluation.telemetry import SKLearnEvaluationLogger
 from sklearn_evaluation.plot.plot import AbstractPlot
+from sklearn_evaluation.plot.classification import _normalize_confusion_matrix
 from ploomber_core.dependencies import requires
 from ploomber_core.exceptions import modify_exceptions
 
@@ -66,7 +67,7 @@ def _confusion_matrix(y_true, y_pred, normalize):
     cm = sk_confusion_matrix(y_true, y_pred)
 
     if normalize:
-        cm = cm.astype("float") / cm.sum(axis=1)[:, np.newaxis]
+        cm = _normalize_confusion_matrix(cm)
 
     return cm
 
@@ -1,6 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from sklearn.metrics import roc_curve, auc
+from sklearn.metrics import auc
 from sklearn.preprocessing import label_binarize, LabelBinarizer
 from sklearn_evaluation.telemetry import SKLearnEvaluationLogger
 from sklearn_evaluation.util import (
@@ -193,8 +193,15 @@ def roc(y_true, y_score, ax=None):
     return r.ax
 
 
+_CHANCE_LINE_GID = "sklearn-evaluation-roc-chance"
+
+
 def _set_ax_settings(ax):
-    ax.plot([0, 1], [0, 1], "k:")
+    # draw the chance line only if the Axes doesn't have one yet, e.g. when
+    # plotting several ROC objects on it (roc1 + roc2)
+    if not any(line.get_gid() == _CHANCE_LINE_GID for line in ax.get_lines()):
+        ax.plot([0, 1], [0, 1], "k:", gid=_CHANCE_LINE_GID)
+
     ax.set_xlim([0.0, 1.0])
     ax.set_ylim([0.0, 1.05])
     ax.set_xlabel("False Positive Rate")
@@ -203,12 +210,157 @@ def _set_ax_settings(ax):
     ax.legend(loc="best")
 
 
-def _roc_curve_multi(y_true, y_score):
-    """Compute micro-average ROC curve"""
-    return roc_curve(y_true.ravel(), y_score.ravel())
+def _fast_roc(y_true, y_score):
+    """
+    Compute the ROC curve of a binary problem
+
+    Equivalent to ``sklearn.metrics.roc_curve`` (without thresholds) but
+    skips its input validation: the points are obtained from a single
+    argsort and a cumulative sum over the labels
+
+    Parameters
+    ----------
+    y_true : array-like, shape = [n_samples]
+        Binary labels, either {0, 1} or {-1, 1}
+
+    y_score : array-like, shape = [n_samples]
+        Target scores for the positive class
+
+    Returns
+    -------
+    fpr : ndarray
+        Increasing false positive rates
+
+    tpr : ndarray
+        Increasing true positive rates
+    """
+    y_true = np.asarray(y_true).ravel()
+    y_score = np.asarray(y_score).ravel()
+
+    is_positive = y_true == 1
+
+    if not np.all(is_positive | (y_true == 0) | (y_true == -1)):
+        raise ValueError(
+            "Expected binary y_true with values in {0, 1} or {-1, 1}. "
+            f"got: {convert_array_to_string(np.unique(y_true))}"
+        )
+
+    # stable sort so samples with tied scores keep a deterministic order
+    order = np.argsort(-y_score, kind="mergesort")
+    y_true_sorted = np.asarray(is_positive[order], dtype=np.int8)
+
+    return _roc_from_sorted(np.cumsum(y_true_sorted, dtype=np.int32), y_score[order])
+
+
+def _sort_columns(y_true_bin, y_score):
+    """
+    Sort every class (column) by decreasing score
+
+    Parameters
+    ----------
+    y_true_bin : array-like, shape = [n_samples, n_classes]
+        One-hot encoded classes
+
+    y_score : array-like, shape = [n_samples, n_classes]
+        Target scores (estimator predictions)
 
+    Returns
+    -------
+    y_true_sorted : ndarray of int8, shape = [n_samples, n_classes]
+        One-hot encoded classes, ordered like ``y_score_sorted``
 
-def _plot_roc(fpr, tpr, ax, label=None, linestyle=None):
+    y_score_sorted : ndarray, shape = [n_samples, n_classes]
+        Scores sorted in decreasing order along every column
+    """
+    y_true_bin = np.asarray(y_true_bin)
+    y_score = np.asarray(y_score)
+
+    order = np.argsort(-y_score, axis=0, kind="mergesort")
+    y_score_sorted = np.take_along_axis(y_score, order, axis=0)
+    y_true_sorted = np.asarray(
+        np.take_along_axis(y_true_bin, order, axis=0) == 1, dtype=np.int8
+    )
+
+    return y_true_sorted, y_score_sorted
+
+
+def _fast_roc_multi(y_true_sorted, y_score_sorted):
+    """
+    Compute the ROC curve of every class (column) with one column-wise
+    cumulative sum. Inputs must come from ``_sort_columns``
+
+    Returns
+    -------
+    fpr : list of ndarray with the fpr values of every class
+
+    tpr : list of ndarray with the tpr values of every class
+    """
+    tps = np.cumsum(y_true_sorted, axis=0, dtype=np.int32)
+
+    curves = [
+        _roc_from_sorted(tps[:, i], y_score_sorted[:, i])
+        for i in range(y_score_sorted.shape[1])
+    ]
+
+    fpr = [fpr_ for fpr_, _ in curves]
+    tpr = [tpr_ for _, tpr_ in curves]
+
+    return fpr, tpr
+
+
+def _roc_from_sorted(tps, y_score_sorted):
+    """
+    Compute fpr and tpr from scores sorted in decreasing order
+
+    Parameters
+    ----------
+    tps : ndarray, shape = [n_samples]
+        Cumulative count of positive samples along the sorted scores
+
+    y_score_sorted : ndarray, shape = [n_samples]
+        Scores sorted in decreasing order
+    """
+    # a threshold is placed at the last sample of every run of tied scores
+    distinct_idx = np.flatnonzero(np.diff(y_score_sorted))
+    threshold_idx = np.r_[distinct_idx, y_score_sorted.size - 1]
+
+    tps = tps[threshold_idx]
+    fps = 1 + threshold_idx - tps
+
+    # drop collinear points, they don't change the curve
+    if tps.size > 2:
+        keep = np.r_[True, np.diff(fps, 2) != 0, True] | np.r_[
+            True, np.diff(tps, 2) != 0, True
+        ]
+        tps = tps[keep]
+        fps = fps[keep]
+
+    tps = np.r_[0, tps]
+    fps = np.r_[0, fps]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fpr = fps / fps[-1]
+        tpr = tps / tps[-1]
+
+    return fpr, tpr
+
+
+def _roc_curve_multi(y_true_sorted, y_score_sorted):
+    """
+    Compute micro-average ROC curve. Inputs must come from ``_sort_columns``
+    """
+    # every column is already sorted, so the flattened scores are n_classes
+    # sorted runs, which a stable (run-aware) sort merges in O(n log n_classes)
+    y_score_flat = y_score_sorted.ravel(order="F")
+    order = np.argsort(-y_score_flat, kind="stable")
+    y_true_flat = y_true_sorted.ravel(order="F")[order]
+
+    return _roc_from_sorted(
+        np.cumsum(y_true_flat, dtype=np.int32), y_score_flat[order]
+    )
+
+
+def _plot_roc(fpr, tpr, ax, label=None, linestyle=None, decorate=True):
     """
     Plot ROC curve
 
@@ -225,6 +377,10 @@ def _plot_roc(fpr, tpr, ax, label=None, linestyle=None):
     ax: matplotlib Axes
         Axes object to draw the plot onto
 
+    decorate : bool, default: True
+        Set the axes labels, limits, title and legend. Pass False when
+        plotting several curves and decorate the axes once at the end
+
     Returns
     -------
     ax: matplotlib Axes
@@ -240,7 +396,8 @@ def _plot_roc(fpr, tpr, ax, label=None, linestyle=None):
 
     ax.plot(fpr, tpr, label=(f"{label} (area = {roc_auc:0.2f})"), linestyle=linestyle)
 
-    _set_ax_settings(ax)
+    if decorate:
+        _set_ax_settings(ax)
 
     return ax
 
@@ -254,7 +411,9 @@ def _generate_plot_from_fpr_tpr_lists(fpr, tpr, ax, label=None, linestyle=None):
         tpr_ = tpr[i]
         label_ = label[i] if label is not None and len(label) > 0 else None
 
-        _plot_roc(fpr_, tpr_, ax, label=label_, linestyle=linestyle)
+        _plot_roc(fpr_, tpr_, ax, label=label_, linestyle=linestyle, decorate=False)
+
+    _set_ax_settings(ax)
 
 
 class ROCAdd(AbstractComposedPlot):
@@ -480,33 +639,37 @@ class ROC(AbstractPlot):
             if _is_y_true_binary:
                 y_true_bin = y_true
             else:
-                y_true_bin = label_binarize(y_true, classes=np.unique(y_true))
+                classes = np.unique(y_true)
+                y_true_bin = label_binarize(y_true, classes=classes)
+
+            # a single sort is shared by the micro-average and every class
+            y_true_sorted, y_score_sorted = _sort_columns(y_true_bin, y_score)
 
             fpr = []
             tpr = []
 
-            avg_fpr, avg_tpr, _ = _roc_curve_multi(y_true_bin, y_score)
+            avg_fpr, avg_tpr = _roc_curve_multi(y_true_sorted, y_score_sorted)
 
             label.append("micro-average ROC curve")
             fpr.append(avg_fpr)
             tpr.append(avg_tpr)
 
-            for i in range(n_classes):
-                fpr_, tpr_, _ = roc_curve(y_true_bin[:, i], y_score[:, i])
+            fpr_classes, tpr_classes = _fast_roc_multi(y_true_sorted, y_score_sorted)
 
-                y_true_class_i = i if _is_y_true_binary else np.unique(y_true)[i]
+            for i in range(n_classes):
+                y_true_class_i = i if _is_y_true_binary else classes[i]
 
                 if not isinstance(y_true_class_i, str):
                     y_true_class_i = i
 
                 label.append(f"(class {y_true_class_i}) ROC curve")
-                fpr.append(fpr_)
-                tpr.append(tpr_)
+                fpr.append(fpr_classes[i])
+                tpr.append(tpr_classes[i])
         else:
             if y_score_is_vector:
-                fpr, tpr, _ = roc_curve(y_true, y_score)
+                fpr, tpr = _fast_roc(y_true, y_score)
             else:
-                fpr, tpr, _ = roc_curve(y_true, y_score[:, 1])
+                fpr, tpr = _fast_roc(y_true, y_score[:, 1])
 
             fpr = [fpr]
             tpr = [tpr]
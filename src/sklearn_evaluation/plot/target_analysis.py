@@ -42,7 +42,9 @@ def _validate_target(y):
 
 @SKLearnEvaluationLogger.log(feature="plot")
 @modify_exceptions
-def target_analysis(y_train, y_test=None, labels=None, colors=None, ax=None):
+def target_analysis(
+    y_train, y_test=None, labels=None, colors=None, ax=None, class_counts=None
+):
     """Target analysis plot for visualising class imbalance.
 
     There are two modes:
@@ -78,6 +80,11 @@ def target_analysis(y_train, y_test=None, labels=None, colors=None, ax=None):
         The axes upon which to plot the curve. If None, the plot is drawn
         on the current Axes
 
+    class_counts : tuple of array-like, optional
+        Precomputed ``(classes, counts)`` of y_train, as returned by
+        ``np.unique(y_train, return_counts=True)``, so the classes are not
+        counted again. Only used in balance mode.
+
     Returns
     -------
     ax: matplotlib Axes
@@ -96,11 +103,20 @@ def target_analysis(y_train, y_test=None, labels=None, colors=None, ax=None):
 
     """
 
-    _validate_target(y_train)
-    _validate_target(y_test)
-    # Get the unique values from the dataset
-    targets = (y_train,) if y_test is None else (y_train, y_test)
-    classes_ = unique_labels(*targets)
+    mode = "balance" if y_test is None else "compare"
+
+    if mode == "balance" and class_counts is not None:
+        classes_, support_ = class_counts
+        # the target type of a 1-D target only depends on its unique values
+        _validate_target(classes_ if np.ndim(y_train) == 1 else y_train)
+    else:
+        _validate_target(y_train)
+        _validate_target(y_test)
+        # Get the unique values from the dataset
+        targets = (y_train,) if y_test is None else (y_train, y_test)
+        classes_ = unique_labels(*targets)
+        support_ = None
+
     if labels is not None:
         if len(labels) != len(classes_):
             raise ValueError(
@@ -110,34 +126,58 @@ def target_analysis(y_train, y_test=None, labels=None, colors=None, ax=None):
                 ).format(len(classes_), len(labels))
             )
 
+    if mode == "balance":
+        if support_ is None:
+            support_ = np.array([(y_train == idx).sum() for idx in classes_])
+
+        return _plot_balance(classes_, support_, labels=labels, colors=colors, ax=ax)
+
     if ax is None:
         _, ax = plt.subplots()
-    mode = "balance" if y_test is None else "compare"
-    if mode == "balance":
-        support_ = np.array([(y_train == idx).sum() for idx in classes_])
-        ax.bar(
-            np.arange(len(support_)),
-            support_,
-            color=colors if colors else "#0070FF",
-            align="center",
-            width=0.5,
-        )
-    else:
-        support_ = np.array([[(y == idx).sum() for idx in classes_] for y in targets])
-        bar_width = 0.35
-        legends = ["train", "test"]
-        colors = colors if colors else ["#0070FF", "#FF9B00"]
-        for idx, support in enumerate(support_):
-            index = np.arange(len(classes_))
-            if idx > 0:
-                index = index + bar_width
 
-            ax.bar(index, support, bar_width, color=colors[idx], label=legends[idx])
+    support_ = np.array([[(y == idx).sum() for idx in classes_] for y in targets])
+    bar_width = 0.35
+    legends = ["train", "test"]
+    colors = colors if colors else ["#0070FF", "#FF9B00"]
+    for idx, support in enumerate(support_):
+        index = np.arange(len(classes_))
+        if idx > 0:
+            index = index + bar_width
 
-    ax.set_title("Class Balance for {:,} Instances".format(support_.sum()))
+        ax.bar(index, support, bar_width, color=colors[idx], label=legends[idx])
+
+    _set_ax_settings(ax, classes_, support_, labels, mode)
+
+    return ax
+
+
+def _plot_balance(classes, support, labels=None, colors=None, ax=None):
+    """
+    Plot the balance mode of the target analysis from precomputed class
+    counts, e.g. from ``np.unique(y, return_counts=True)``
+    """
+    if ax is None:
+        _, ax = plt.subplots()
+
+    support = np.asarray(support)
+    ax.bar(
+        np.arange(len(support)),
+        support,
+        color=colors if colors else "#0070FF",
+        align="center",
+        width=0.5,
+    )
+
+    _set_ax_settings(ax, classes, support, labels, "balance")
+
+    return ax
+
+
+def _set_ax_settings(ax, classes, support, labels, mode):
+    ax.set_title("Class Balance for {:,} Instances".format(support.sum()))
 
     # Set the x ticks with the class names or labels if specified
-    labels = labels if labels else classes_
+    labels = labels if labels else classes
     xticks = np.arange(len(labels))
     if mode == "compare":
         xticks = xticks + (0.35 / 2)
@@ -146,7 +186,7 @@ def target_analysis(y_train, y_test=None, labels=None, colors=None, ax=None):
     ax.set_xticklabels(labels)
 
     # Compute the ceiling for the y limit
-    cmax = support_.max()
+    cmax = support.max()
     ax.set_ylim(0, cmax + cmax * 0.1)
     ax.set_ylabel("support")
 
@@ -157,5 +197,3 @@ def target_analysis(y_train, y_test=None, labels=None, colors=None, ax=None):
 
     if mode == "compare":
         ax.legend(frameon=True)
-
-    return ax
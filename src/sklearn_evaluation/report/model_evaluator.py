@@ -1,17 +1,19 @@
 from sklearn.metrics import accuracy_score
-from sklearn.metrics import auc
 import re
 from sklearn_evaluation import plot
 from sklearn_evaluation.report.util import (
     Range,
     run_if_args_are_not_none,
     gen_ax,
-    check_model
+    check_model,
+    _fast_predict_proba,
 )
 from sklearn_evaluation.report import ModelHeuristics, ReportSection
 import time
+import matplotlib.pyplot as plt
 import numpy as np
 from sklearn_evaluation.telemetry import SKLearnEvaluationLogger
+from sklearn_evaluation.util import trapezoid
 
 
 COMMUNITY_LINK = "https://ploomber.io/community"
@@ -22,6 +24,67 @@ COMMUNITY = (
     + "target='_blank'>slack</a>"
 )
 
+_CLASS_LABEL_RE = re.compile(r"^\(class [^)]*\)")
+
+
+def _accuracy_score(y_true, y_pred):
+    """
+    Same as sklearn's accuracy_score. 1-D integer labels skip sklearn's
+    input validation and are compared and counted in a single pass
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+
+    if (
+        y_true.ndim == 1
+        and y_true.size > 0
+        and y_true.shape == y_pred.shape
+        and np.issubdtype(y_true.dtype, np.integer)
+        and np.issubdtype(y_pred.dtype, np.integer)
+    ):
+        return np.count_nonzero(y_true == y_pred) / y_true.size
+
+    return accuracy_score(y_true, y_pred)
+
+
+def _compute_aucs(fpr, tpr):
+    """
+    Computes the area under every (fpr, tpr) curve with a single trapezoid
+    call. Curves with fewer points are padded with their last value, which
+    adds zero area
+    """
+    n_points = max(len(fpr_) for fpr_ in fpr)
+
+    def _stack(curves):
+        return np.stack(
+            [
+                np.pad(
+                    np.asarray(curve, dtype=float),
+                    (0, n_points - len(curve)),
+                    mode="edge",
+                )
+                for curve in curves
+            ]
+        )
+
+    return trapezoid(_stack(tpr), _stack(fpr), axis=1)
+
+
+def _is_balanced(counts, balance_threshold=0.05):
+    """
+    Checks if every class weight, given the class counts, is within
+    balance_threshold of the expected (uniform) weight
+    """
+    n_values = counts.sum()
+    expected_balance = 1 / len(counts)
+
+    weights = list(map(lambda count: count / n_values, counts))
+    expected_range = Range(
+        expected_balance - balance_threshold, expected_balance + balance_threshold
+    )
+
+    return all(expected_range.in_range(w) for w in weights)
+
 
 class ModelEvaluator(ModelHeuristics):
     """
@@ -45,8 +108,44 @@ class ModelEvaluator(ModelHeuristics):
 
     def __init__(self, model):
         self.model = model
+        self._predictions_cache = dict()
         super().__init__()
 
+    def _is_prediction_cached(self, method, X):
+        """
+        Checks if model.<method>(X) was already computed
+        """
+        cached = self._predictions_cache.get((method, id(X)))
+        return cached is not None and cached[0] is X
+
+    def _get_cached_prediction(self, method, X):
+        """
+        Returns the output of model.<method>(X), computing it only once for
+        every X
+        """
+        # keep a reference to X so its id is not reused while cached
+        if not self._is_prediction_cached(method, X):
+            if method == "predict_proba":
+                prediction = _fast_predict_proba(self.model, X)
+            else:
+                prediction = getattr(self.model, method)(X)
+
+            self._predictions_cache[(method, id(X))] = (X, prediction)
+
+        return self._predictions_cache[(method, id(X))][1]
+
+    def _predict(self, X):
+        """
+        Returns model.predict(X), reusing previous results for the same X
+        """
+        return self._get_cached_prediction("predict", X)
+
+    def _predict_proba(self, X):
+        """
+        Returns model.predict_proba(X), reusing previous results for the same X
+        """
+        return self._get_cached_prediction("predict_proba", X)
+
     @run_if_args_are_not_none
     def evaluate_balance(self, y_true, custom_section=None):
         """
@@ -56,14 +155,16 @@ class ModelEvaluator(ModelHeuristics):
         """
         balance_section = custom_section or ReportSection("balance")
 
-        is_balanced = self.check_array_balance(y_true)
+        # count once, both the balance check and the plot use the counts
+        classes, counts = np.unique(np.asarray(y_true), return_counts=True)
+        is_balanced = _is_balanced(counts)
 
         if is_balanced:
             balance_section.set_is_ok(True)
             balance_section.append_guideline("Your dataset is balanced")
         else:
             balance_section.set_is_ok(False)
-            p = plot.target_analysis(y_true)
+            p = plot.target_analysis(y_true, class_counts=(classes, counts))
             balance_section.append_guideline("Your test set is highly imbalanced")
             balance_section.append_guideline(p)
             balance_section.append_guideline(COMMUNITY)
@@ -84,7 +185,7 @@ class ModelEvaluator(ModelHeuristics):
 
         try:
             accuracy_threshold = 0.8
-            accuracy = accuracy_score(y_true, y_pred_test)
+            accuracy = _accuracy_score(y_true, y_pred_test)
 
             accuracy_section.append_guideline(f"Accuracy is {accuracy}")
             if accuracy >= accuracy_threshold:
@@ -118,34 +219,32 @@ class ModelEvaluator(ModelHeuristics):
         auc_section = custom_section or ReportSection("auc")
 
         auc_threshold_low_range = Range(0, 0.7)
-        auc_threshold_acceptable_range = Range(0.7, 0.8)
 
         # auc - roc
         roc = plot.ROC.from_raw_data(y_true, y_score)
-        list_of_auc = []
-        for i in range(len(roc.fpr)):
-            roc_auc = auc(roc.fpr[i], roc.tpr[i])
-            list_of_auc.append(roc_auc)
+        aucs = _compute_aucs(roc.fpr, roc.tpr)
+        list_of_auc = aucs.tolist()
+
+        is_low = (aucs >= auc_threshold_low_range.min) & (
+            aucs <= auc_threshold_low_range.max
+        )
+
+        if not is_low.all():
+            auc_section.set_is_ok(True)
 
+        for i in np.flatnonzero(is_low):
             # TODO: better check
             label = roc.label[i] if len(roc.label) > 0 else f"class {i}"
-            r = re.match(r"^\(class (.)*\)", label)
-            if r:
-                class_name = r[0].replace("(", "").replace(")", "")
-            else:
-                class_name = label
+            class_name = label
+            if label.startswith("(class "):
+                r = _CLASS_LABEL_RE.match(label)
+                if r:
+                    class_name = r[0][1:-1]
 
-            if auc_threshold_low_range.in_range(roc_auc):
-                auc_section.append_guideline(
-                    f"Area under curve is low for {class_name}"
-                )
-                class_roc = plot.ROC(roc.fpr[i], roc.tpr[i], label=[label]).plot().ax
-                auc_section.append_guideline(class_roc)
-                auc_section.append_guideline(COMMUNITY)
-            elif auc_threshold_acceptable_range.in_range(roc_auc):
-                auc_section.set_is_ok(True)
-            else:
-                auc_section.set_is_ok(True)
+            auc_section.append_guideline(f"Area under curve is low for {class_name}")
+            class_roc = plot.ROC(roc.fpr[i], roc.tpr[i], label=[label]).plot().ax
+            auc_section.append_guideline(class_roc)
+            auc_section.append_guideline(COMMUNITY)
 
         auc_section.append_guideline(f"Number of classes : {len(list_of_auc)}")
 
@@ -169,12 +268,20 @@ class ModelEvaluator(ModelHeuristics):
         """
         general_section = custom_section or ReportSection("general_stats")
 
-        if y_true is not None and y_pred is not None:
+        plot_cm = y_true is not None and y_pred is not None
+        plot_roc = y_true is not None and y_score is not None
+
+        if plot_cm and plot_roc:
+            # share a single figure, the section renders it once
+            _, (ax_cm, ax_roc) = plt.subplots(1, 2, figsize=(10, 4))
+            plot.confusion_matrix(y_true, y_pred, ax=ax_cm)
+            plot.roc(y_true, y_score, ax=ax_roc)
+            general_section.append_guideline(ax_cm)
+        elif plot_cm:
             general_section.append_guideline(
                 plot.confusion_matrix(y_true, y_pred, ax=gen_ax())
             )
-
-        if y_true is not None and y_score is not None:
+        elif plot_roc:
             general_section.append_guideline(plot.roc(y_true, y_score, ax=gen_ax()))
 
         if y_true is not None and X_test is not None:
@@ -190,7 +297,7 @@ class ModelEvaluator(ModelHeuristics):
         """
         precision_recall_section = custom_section or ReportSection("precision_recall")
         try:
-            y_prob = self.model.predict_proba(X_test)
+            y_prob = self._predict_proba(X_test)
             pr = plot.PrecisionRecall.from_raw_data(
                 y_true, y_prob, label=self._get_model_name(self.model)
             )
@@ -214,7 +321,7 @@ class ModelEvaluator(ModelHeuristics):
         """
         calibration_section = custom_section or ReportSection("calibration")
         try:
-            y_prob = self.model.predict_proba(X_test)
+            y_prob = self._predict_proba(X_test)
             calibration_plot = plot.CalibrationCurve.from_raw_data(
                 [y_true],
                 [y_prob],
@@ -236,22 +343,31 @@ class ModelEvaluator(ModelHeuristics):
         """
         Returns list of roc auc
         """
-        roc_auc = []
         roc = plot.ROC.from_raw_data(y_test, y_score)
-        for i in range(len(roc.fpr)):
-            roc_auc.append(auc(roc.fpr[i], roc.tpr[i]))
-
-        return roc_auc
+        return _compute_aucs(roc.fpr, roc.tpr).tolist()
 
     @run_if_args_are_not_none
-    def get_model_prediction_time(self, X) -> float:
+    def get_model_prediction_time(self, X, n_repeats=3, time_budget=0.1) -> float:
         """
-        Returns model.predict(X) time in seconds
+        Returns the median model.predict(X) time in seconds over up to
+        n_repeats runs. Runs stop once they took time_budget seconds in total
+
+        A warm-up prediction on a single sample runs first so one-time
+        costs (e.g. lazy allocations) are not measured
         """
-        start = time.time()
-        self.model.predict(X)
-        end = time.time()
-        eval_time = end - start  # in seconds
+        self.model.predict(X[:1])
+
+        time_budget_ns = time_budget * 1e9
+        timings = []
+        for _ in range(n_repeats):
+            start = time.perf_counter_ns()
+            self.model.predict(X)
+            timings.append(time.perf_counter_ns() - start)
+
+            if sum(timings) >= time_budget_ns:
+                break
+
+        eval_time = float(np.median(timings)) / 1e9  # in seconds
         return eval_time
 
     @run_if_args_are_not_none
@@ -261,18 +377,8 @@ class ModelEvaluator(ModelHeuristics):
 
         Balance threshold is 0.05
         """
-        classes, counts = np.unique(array, return_counts=True)
-        n_classes = len(classes)
-        n_values = len(array)
-        expected_balance = 1 / n_classes
-
-        weights = list(map(lambda count: count / n_values, counts))
-        balance_threshold = 0.05
-        expected_range = Range(
-            expected_balance - balance_threshold, expected_balance + balance_threshold
-        )
-
-        return all(expected_range.in_range(w) for w in weights)
+        _, counts = np.unique(array, return_counts=True)
+        return _is_balanced(counts)
 
 
 @SKLearnEvaluationLogger.log(feature="report", action="evaluate_model")
@@ -11,15 +11,15 @@ class ReportSection:
     Section to include in report
     """
 
+    __slots__ = ("report_section", "key")
+
     def __init__(self, key, include_in_report=True):
-        self.report_section = dict(
-            {
-                "guidelines": [],
-                "title": key.replace("_", " "),
-                "include_in_report": include_in_report,
-                "is_ok": False,
-            }
-        )
+        self.report_section = {
+            "guidelines": [],
+            "title": key.replace("_", " "),
+            "include_in_report": include_in_report,
+            "is_ok": False,
+        }
         self.key = key
 
     def append_guideline(self, guideline):
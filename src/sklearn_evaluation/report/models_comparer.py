@@ -1,3 +1,6 @@
+from joblib import Parallel, delayed
+import numpy as np
+from sklearn.utils.multiclass import unique_labels
 from sklearn_evaluation import plot
 from sklearn_evaluation.report.util import (
     run_if_args_are_not_none,
@@ -7,6 +10,17 @@ from sklearn_evaluation.report import ModelHeuristics, ReportSection, ModelEvalu
 from sklearn_evaluation.telemetry import SKLearnEvaluationLogger
 
 
+def _try_cache_prediction(evaluator, method, X):
+    """
+    Populates the evaluator predictions cache. Errors are ignored here so
+    they are raised (and reported) by the section requesting the prediction
+    """
+    try:
+        evaluator._get_cached_prediction(method, X)
+    except Exception:
+        pass
+
+
 class ModelsComparer(ModelHeuristics):
     """
     Model comparison helper
@@ -37,6 +51,47 @@ class ModelsComparer(ModelHeuristics):
 
         super().__init__()
 
+    def _predict_in_parallel(self, method, X_test):
+        """
+        Computes model_a and model_b <method>(X_test) concurrently when
+        neither is cached yet. Tree ensembles release the GIL while
+        predicting, so threads avoid the overhead of spawning processes
+        """
+        evaluators = (self.evaluator_a, self.evaluator_b)
+
+        if not any(e._is_prediction_cached(method, X_test) for e in evaluators):
+            Parallel(n_jobs=2, backend="threading")(
+                delayed(_try_cache_prediction)(e, method, X_test) for e in evaluators
+            )
+
+    def _predict_proba_a(self, X_test):
+        """
+        Returns model_a.predict_proba(X_test), computed once per X_test
+        """
+        self._predict_in_parallel("predict_proba", X_test)
+        return self.evaluator_a._predict_proba(X_test)
+
+    def _predict_proba_b(self, X_test):
+        """
+        Returns model_b.predict_proba(X_test), computed once per X_test
+        """
+        self._predict_in_parallel("predict_proba", X_test)
+        return self.evaluator_b._predict_proba(X_test)
+
+    def _predict_a(self, X_test):
+        """
+        Returns model_a.predict(X_test), computed once per X_test
+        """
+        self._predict_in_parallel("predict", X_test)
+        return self.evaluator_a._predict(X_test)
+
+    def _predict_b(self, X_test):
+        """
+        Returns model_b.predict(X_test), computed once per X_test
+        """
+        self._predict_in_parallel("predict", X_test)
+        return self.evaluator_b._predict(X_test)
+
     @run_if_args_are_not_none
     def precision_and_recall(self, X_test, y_true):
         """
@@ -44,6 +99,8 @@ class ModelsComparer(ModelHeuristics):
         """
         precision_recall_section = ReportSection("precision_recall")
 
+        self._predict_in_parallel("predict_proba", X_test)
+
         pr_a = self.evaluator_a.evaluate_precision_and_recall(
             X_test, y_true, precision_recall_section
         )
@@ -67,7 +124,7 @@ class ModelsComparer(ModelHeuristics):
         auc_section = ReportSection("auc")
 
         try:
-            y_score_a = self.model_a.predict_proba(X_test)
+            y_score_a = self._predict_proba_a(X_test)
             roc_auc_model_a = self.evaluator_a.get_roc_auc(y_true, y_score_a)
 
             if len(roc_auc_model_a) > 1:
@@ -88,7 +145,7 @@ class ModelsComparer(ModelHeuristics):
             )
 
         try:
-            y_score_b = self.model_b.predict_proba(X_test)
+            y_score_b = self._predict_proba_b(X_test)
             roc_auc_model_b = self.evaluator_b.get_roc_auc(y_true, y_score_b)
 
             if len(roc_auc_model_b) > 1:
@@ -158,6 +215,8 @@ class ModelsComparer(ModelHeuristics):
         """
         calibration_section = ReportSection("calibration")
 
+        self._predict_in_parallel("predict_proba", X_test)
+
         self.evaluator_a.evaluate_calibration(X_test, y_true, calibration_section)
         self.evaluator_b.evaluate_calibration(X_test, y_true, calibration_section)
 
@@ -171,11 +230,25 @@ class ModelsComparer(ModelHeuristics):
         combined_confusion_matrix_section = ReportSection("combined_confusion_matrix")
 
         try:
-            y_score_a = self.model_a.predict(X_test)
-            y_score_b = self.model_b.predict(X_test)
+            y_score_a = self._predict_a(X_test)
+            y_score_b = self._predict_b(X_test)
 
-            model_a_cm = plot.ConfusionMatrix.from_raw_data(y_true, y_score_a)
-            model_b_cm = plot.ConfusionMatrix.from_raw_data(y_true, y_score_b)
+            # raises on continuous (e.g. regressor) or mixed label types, as
+            # sklearn's confusion_matrix does, and returns the sorted classes
+            classes = unique_labels(y_true, y_score_a, y_score_b)
+
+            # encode the labels of both models with a single searchsorted pass
+            codes = np.searchsorted(
+                classes, np.concatenate([np.asarray(y_true), y_score_a, y_score_b])
+            )
+            y_true_codes, y_score_a_codes, y_score_b_codes = np.split(codes, 3)
+
+            model_a_cm = plot.ConfusionMatrix._from_encoded(
+                y_true_codes, y_score_a_codes, classes
+            )
+            model_b_cm = plot.ConfusionMatrix._from_encoded(
+                y_true_codes, y_score_b_codes, classes
+            )
 
             combined = model_a_cm + model_b_cm
             combined_confusion_matrix_section.append_guideline(combined.plot())
@@ -199,10 +272,10 @@ class ModelsComparer(ModelHeuristics):
         combined_pr_section = ReportSection("combined_pr")
 
         try:
-            y_prob_a = self.model_a.predict_proba(X_test)
+            y_prob_a = self._predict_proba_a(X_test)
             pr_a = plot.PrecisionRecall.from_raw_data(y_true, y_prob_a)
 
-            y_prob_b = self.model_b.predict_proba(X_test)
+            y_prob_b = self._predict_proba_b(X_test)
             pr_b = plot.PrecisionRecall.from_raw_data(y_true, y_prob_b)
             pr_combined = pr_a + pr_b
             combined_pr_section.append_guideline(pr_combined.ax_)
@@ -1,5 +1,11 @@
+import threading
+
 from jinja2 import Environment, PackageLoader
+from joblib import Parallel, delayed
 import matplotlib.pyplot as plt
+import numpy as np
+from scipy import sparse
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
 
 
 def jinja_env():
@@ -44,6 +50,50 @@ def gen_ax():
     return ax
 
 
+def _accumulate_tree_proba(tree, X, out, lock):
+    """
+    Adds tree.predict_proba(X) to out
+    """
+    tree_proba = tree.predict_proba(X, check_input=False)
+    with lock:
+        out += tree_proba
+
+
+def _fast_predict_proba(model, X):
+    """
+    Returns model.predict_proba(X). For single-output random forests
+    fitted with the default n_jobs, the trees are evaluated in parallel
+    threads (tree prediction releases the GIL), otherwise the model's
+    own predict_proba is used
+    """
+    is_parallel_forest = (
+        isinstance(model, (RandomForestClassifier, ExtraTreesClassifier))
+        and hasattr(model, "estimators_")
+        and model.n_outputs_ == 1
+        and getattr(model, "n_jobs", None) in (None, 1)
+        and not sparse.issparse(X)
+    )
+
+    if not is_parallel_forest:
+        return model.predict_proba(X)
+
+    # the forest's own input check (feature names, missing values), done
+    # once instead of once per tree
+    X = model._validate_X_predict(X)
+
+    # columns follow model.classes_, accumulate to avoid storing every output
+    proba = np.zeros((X.shape[0], model.n_classes_), dtype=np.float64)
+    lock = threading.Lock()
+
+    Parallel(n_jobs=-1, backend="threading")(
+        delayed(_accumulate_tree_proba)(tree, X, proba, lock)
+        for tree in model.estimators_
+    )
+
+    proba /= len(model.estimators_)
+    return proba
+
+
 def check_model(model) -> None:
     """
     Validate model
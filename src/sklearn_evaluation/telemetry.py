@@ -20,6 +20,9 @@ class SKLearnEvaluationLogger:
     def flags():
         return ["is_report"]
 
+    # evaluated once at class creation, flags are looked up on every call
+    _flags = frozenset(flags())
+
     @classmethod
     def log(self, action=None, feature=None):
         """Logs the function and then runs it
@@ -36,10 +39,20 @@ class SKLearnEvaluationLogger:
         """
 
         def wrapper(func):
+            # everything that doesn't depend on the call arguments is
+            # computed once, when the function is decorated
+            base_metadata = {"action": action or func.__name__, "feature": feature}
+            sig = signature(func)
+            args_with_default_values = frozenset(
+                name
+                for name, param in sig.parameters.items()
+                if param.default is not inspect._empty
+            )
+
             @wraps(func)
             def inner(*args, **kwargs):
                 metadata = self._prepare_metadata(
-                    self, func, action, feature, *args, **kwargs
+                    self, base_metadata, sig, args_with_default_values, *args, **kwargs
                 )
                 telemetry.log_api("sklearn-evaluation", metadata=metadata)
 
@@ -56,24 +69,17 @@ class SKLearnEvaluationLogger:
 
         return wrapper
 
-    def _get_func_arguments_to_log(self, func, *args, **kwargs):
+    def _get_func_arguments_to_log(
+        self, sig, args_with_default_values, *args, **kwargs
+    ):
         args_to_log = dict()
         flags = dict({})
 
-        sig = signature(func)
         bound = sig.bind(*args, **kwargs)
         bound.apply_defaults()
-        arguments = bound.arguments
-        args_with_default_values = []
-
-        for tupple in sig.parameters.items():
-            param_name = tupple[0]
-            param_value = tupple[1]
-            if param_value.default is not inspect._empty:
-                args_with_default_values.append(param_name)
 
         # extract only args with default values
-        for key, value in arguments.items():
+        for key, value in bound.arguments.items():
             if key in args_with_default_values:
                 args_to_log[key] = value
 
@@ -83,22 +89,16 @@ class SKLearnEvaluationLogger:
         return args_to_log, flags
 
     def _extract_flags(self, **kwargs):
-        flags = dict({})
-        for key, value in kwargs.items():
-            if self._is_flag(self, key):
-                flags[key] = value
-
-        return flags
-
-    def _is_flag(self, key):
-        flags = self.flags()
-        return key in flags
+        return {key: kwargs[key] for key in self._flags.intersection(kwargs)}
 
-    def _prepare_metadata(self, func, action, feature, *args, **kwargs):
-        _action = action or func.__name__
-        _args, _flags = self._get_func_arguments_to_log(self, func, *args, **kwargs)
+    def _prepare_metadata(
+        self, base_metadata, sig, args_with_default_values, *args, **kwargs
+    ):
+        _args, _flags = self._get_func_arguments_to_log(
+            self, sig, args_with_default_values, *args, **kwargs
+        )
 
-        metadata = {"action": _action, "feature": feature}
+        metadata = {**base_metadata}
 
         if len(_args) > 0:
             metadata["args"] = _args
@@ -7,6 +7,9 @@ from itertools import product
 from six import string_types
 import numpy as np
 
+# np.trapz was renamed to np.trapezoid in numpy 2.0
+trapezoid = getattr(np, "trapezoid", None) or getattr(np, "trapz")
+
 
 def isiter(obj):
     try:
@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+import matplotlib.pyplot as plt
 from sklearn_evaluation import plot, __version__
 
 import warnings
@@ -38,6 +39,54 @@ def test_from_raw_data(y, normalize, target_names, target_names_expected):
     }
 
 
+def test_from_raw_data_normalize_class_without_samples():
+    # class 2 is predicted but never appears in y_true
+    y_true = np.array([0, 0, 1, 1])
+    y_pred = np.array([0, 2, 1, 1])
+
+    cm = plot.ConfusionMatrix.from_raw_data(y_true, y_pred, normalize=True)
+
+    np.testing.assert_allclose(
+        cm.cm, [[0.5, 0.0, 0.5], [0.0, 1.0, 0.0], [0.0, 0.0, 0.0]]
+    )
+
+
+def test_from_raw_data_normalize_dump_keeps_precision(tmp_directory):
+    y_true = np.array([0, 0, 0, 1, 1, 1])
+    y_pred = np.array([0, 1, 1, 1, 1, 1])
+
+    cm = plot.ConfusionMatrix.from_raw_data(y_true, y_pred, normalize=True)
+
+    assert cm._get_data()["cm"] == [[1 / 3, 2 / 3], [0.0, 1.0]]
+
+    cm.dump("cm.json")
+    assert plot.ConfusionMatrix.from_dump("cm.json")._get_data() == cm._get_data()
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_from_encoded(normalize):
+    y_true = np.array(["a", "b", "c", "a", "b", "c", "a"])
+    y_pred = np.array(["a", "c", "c", "b", "b", "a", "a"])
+
+    classes, codes = np.unique(np.concatenate([y_true, y_pred]), return_inverse=True)
+    y_true_codes, y_pred_codes = np.split(codes, 2)
+
+    cm = plot.ConfusionMatrix._from_encoded(
+        y_true_codes, y_pred_codes, classes, normalize=normalize
+    )
+    expected = plot.ConfusionMatrix.from_raw_data(y_true, y_pred, normalize=normalize)
+
+    np.testing.assert_allclose(cm.cm, expected.cm)
+    assert cm.target_names == expected.target_names
+
+
+def test_confusion_matrix_uses_given_ax(y):
+    y_true, y_pred = y
+    _, ax = plt.subplots()
+
+    assert plot.confusion_matrix(y_true, y_pred, ax=ax) is ax
+
+
 def test_dump(tmp_directory, y):
     y_true, y_pred = y
     cm = plot.ConfusionMatrix.from_raw_data(y_true, y_pred)
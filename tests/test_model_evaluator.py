@@ -1,6 +1,15 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
 import pytest
+from sklearn.datasets import make_classification
+from sklearn.metrics import accuracy_score, auc
+from sklearn_evaluation.plot import ROC
 from sklearn_evaluation.report import ModelEvaluator, evaluate_model
-from sklearn.ensemble import RandomForestClassifier
+from sklearn_evaluation.report.model_evaluator import _accuracy_score, _compute_aucs
+from sklearn_evaluation.report.util import _fast_predict_proba
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.model_selection import train_test_split
 from sklearn.tree import DecisionTreeClassifier
@@ -174,9 +183,9 @@ def test_model_evaluator_auc(
 @pytest.mark.parametrize(
     "model, expected_guidelines, number_of_expected_plots",
     [
-        [RandomForestClassifier(), [], 2],
-        [DecisionTreeClassifier(), [], 2],
-        [LogisticRegression(), [], 2],
+        [RandomForestClassifier(), [], 1],
+        [DecisionTreeClassifier(), [], 1],
+        [LogisticRegression(), [], 1],
     ],
 )
 def test_model_evaluator_generate_general_stats(
@@ -203,3 +212,104 @@ def _test_model_results(model, key, expected_guidelines, number_of_expected_plot
 
     for expected_guideline in expected_guidelines:
         assert any(expected_guideline in str(guideline) for guideline in guidelines)
+
+
+@pytest.mark.parametrize(
+    "y_true, y_pred",
+    [
+        [np.array([0, 1, 2, 1, 0]), np.array([0, 2, 2, 1, 1])],
+        [np.array([0, 1, 1], dtype=np.int8), np.array([0, 1, 1], dtype=np.int64)],
+        [[3, 1, 2], [3, 1, 1]],
+        [np.array(["a", "b", "a"]), np.array(["a", "a", "a"])],
+        [np.array([0.0, 1.0, 1.0]), np.array([0.0, 1.0, 0.0])],
+    ],
+)
+def test_accuracy_score_matches_sklearn(y_true, y_pred):
+    assert _accuracy_score(y_true, y_pred) == accuracy_score(y_true, y_pred)
+
+
+def test_accuracy_score_length_mismatch_error():
+    with pytest.raises(ValueError):
+        _accuracy_score(np.array([0, 1, 1]), np.array([0, 1]))
+
+
+def test_compute_aucs_matches_sklearn():
+    rng = np.random.default_rng(42)
+    y_true = rng.integers(0, 3, size=200)
+    y_score = rng.random((200, 3))
+
+    roc = ROC.from_raw_data(y_true, y_score)
+    expected = [auc(fpr, tpr) for fpr, tpr in zip(roc.fpr, roc.tpr)]
+
+    np.testing.assert_allclose(_compute_aucs(roc.fpr, roc.tpr), expected)
+
+
+def test_get_model_prediction_time(monkeypatch):
+    X, y = make_classification(n_samples=100, random_state=0)
+    model = DecisionTreeClassifier().fit(X, y)
+    mock = Mock(wraps=model.predict)
+    monkeypatch.setattr(model, "predict", mock)
+
+    me = ModelEvaluator(model)
+    eval_time = me.get_model_prediction_time(X, n_repeats=3, time_budget=10)
+
+    assert isinstance(eval_time, float)
+    assert eval_time > 0
+    # one warm-up call on a single sample plus the timed runs
+    assert mock.call_count == 4
+    assert len(mock.call_args_list[0][0][0]) == 1
+
+
+def test_get_model_prediction_time_stops_after_time_budget(monkeypatch):
+    X, y = make_classification(n_samples=100, random_state=0)
+    model = DecisionTreeClassifier().fit(X, y)
+    mock = Mock(wraps=model.predict)
+    monkeypatch.setattr(model, "predict", mock)
+
+    me = ModelEvaluator(model)
+    me.get_model_prediction_time(X, n_repeats=3, time_budget=0)
+
+    # warm-up plus a single timed run
+    assert mock.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        RandomForestClassifier(n_estimators=10, random_state=0),
+        RandomForestClassifier(n_estimators=10, n_jobs=2, random_state=0),
+        ExtraTreesClassifier(n_estimators=10, random_state=0),
+        LogisticRegression(),
+    ],
+)
+def test_fast_predict_proba(model):
+    X, y = make_classification(
+        n_samples=300, n_classes=3, n_informative=4, random_state=0
+    )
+    model.fit(X, y)
+
+    np.testing.assert_allclose(_fast_predict_proba(model, X), model.predict_proba(X))
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        RandomForestClassifier(n_estimators=10, random_state=0),
+        ExtraTreesClassifier(n_estimators=10, random_state=0),
+    ],
+)
+def test_fast_predict_proba_missing_values(model):
+    X, y = make_classification(n_samples=300, random_state=0)
+    X[::7, 0] = np.nan
+    model.fit(X, y)
+
+    np.testing.assert_allclose(_fast_predict_proba(model, X), model.predict_proba(X))
+
+
+def test_fast_predict_proba_feature_names_mismatch_error():
+    X, y = make_classification(n_samples=100, n_features=4, random_state=0)
+    X = pd.DataFrame(X, columns=["a", "b", "c", "d"])
+    model = RandomForestClassifier(n_estimators=10, random_state=0).fit(X, y)
+
+    with pytest.raises(ValueError, match="feature names should match"):
+        _fast_predict_proba(model, X[["d", "c", "b", "a"]])
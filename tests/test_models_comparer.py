@@ -1,5 +1,8 @@
+from unittest.mock import Mock
+
 import pytest
 from sklearn_evaluation.report import ModelsComparer, compare_models
+from sklearn.datasets import load_breast_cancer, make_classification
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.model_selection import train_test_split
@@ -341,6 +344,55 @@ def _test_model_results(mc, key, expected_guidelines, number_of_expected_plots):
         assert any(expected_guideline in str(guideline) for guideline in guidelines)
 
 
+@pytest.mark.parametrize(
+    "model_a, model_b",
+    [
+        [LinearRegression(), DecisionTreeClassifier()],
+        [LinearRegression(), LinearRegression()],
+        [RandomForestClassifier(), LinearRegression()],
+    ],
+)
+def test_combined_cm_regressor_error(model_a, model_b):
+    X, y = load_breast_cancer(return_X_y=True)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=2023
+    )
+
+    model_a.fit(X_train, y_train)
+    model_b.fit(X_train, y_train)
+
+    mc = ModelsComparer(model_a, model_b)
+    mc.add_combined_cm(X_test, y_test)
+    _test_model_results(
+        mc,
+        "combined_confusion_matrix",
+        ["Failed to calculate combined_confusion_matrix"],
+        0,
+    )
+
+
+def test_predictions_are_computed_once_per_model(monkeypatch):
+    X, y = make_classification(n_samples=200, random_state=0)
+    model_a = LogisticRegression().fit(X, y)
+    model_b = DecisionTreeClassifier().fit(X, y)
+
+    mocks = {}
+    for model in (model_a, model_b):
+        for method in ("predict", "predict_proba"):
+            mock = Mock(wraps=getattr(model, method))
+            monkeypatch.setattr(model, method, mock)
+            mocks[(model, method)] = mock
+
+    mc = ModelsComparer(model_a, model_b)
+    mc.precision_and_recall(X, y)
+    mc.auc(X, y)
+    mc.calibration(X, y)
+    mc.add_combined_cm(X, y)
+    mc.add_combined_pr(X, y)
+
+    assert all(mock.call_count == 1 for mock in mocks.values())
+
+
 def test_functions_with_none_inputs():
     model_a = RandomForestClassifier()
     model_b = DecisionTreeClassifier()
@@ -1,11 +1,19 @@
 import pytest
 import numpy as np
+import matplotlib.pyplot as plt
 from sklearn_evaluation import plot, __version__
+from sklearn_evaluation.plot.roc import (
+    _fast_roc,
+    _fast_roc_multi,
+    _roc_curve_multi,
+    _sort_columns,
+)
 
 from functools import partial
 import sys
 from matplotlib.testing.decorators import image_comparison as _image_comparison
 from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_curve
 from sklearn.model_selection import train_test_split
 
 # older versions of Python are not compatible with the latest version of
@@ -550,3 +558,80 @@ def test_roc_multi_add_to_multi(
     roc1 = plot.ROC(fpr1, tpr1, label=label).plot()
     roc2 = plot.ROC.from_raw_data(y_test_roc2, y_score_roc2)
     roc1 + roc2
+
+
+@pytest.mark.parametrize("decimals", [None, 1])
+@pytest.mark.parametrize("negative_label", [0, -1])
+def test_fast_roc_matches_sklearn(decimals, negative_label):
+    rng = np.random.default_rng(0)
+    y_true = np.where(rng.integers(0, 2, size=500) == 1, 1, negative_label)
+    y_score = rng.random(500)
+
+    if decimals is not None:
+        y_score = np.round(y_score, decimals)
+
+    expected_fpr, expected_tpr, _ = roc_curve(y_true, y_score)
+    fpr, tpr = _fast_roc(y_true, y_score)
+
+    np.testing.assert_allclose(fpr, expected_fpr)
+    np.testing.assert_allclose(tpr, expected_tpr)
+
+
+def test_fast_roc_multi_matches_sklearn():
+    rng = np.random.default_rng(0)
+    y_true_bin = np.eye(4, dtype=int)[rng.integers(0, 4, size=300)]
+    y_score = np.round(rng.random((300, 4)), 2)
+
+    y_true_sorted, y_score_sorted = _sort_columns(y_true_bin, y_score)
+    fpr, tpr = _fast_roc_multi(y_true_sorted, y_score_sorted)
+
+    for i in range(4):
+        expected_fpr, expected_tpr, _ = roc_curve(y_true_bin[:, i], y_score[:, i])
+        np.testing.assert_allclose(fpr[i], expected_fpr)
+        np.testing.assert_allclose(tpr[i], expected_tpr)
+
+    avg_fpr, avg_tpr = _roc_curve_multi(y_true_sorted, y_score_sorted)
+    expected_fpr, expected_tpr, _ = roc_curve(y_true_bin.ravel(), y_score.ravel())
+    np.testing.assert_allclose(avg_fpr, expected_fpr)
+    np.testing.assert_allclose(avg_tpr, expected_tpr)
+
+
+def test_roc_area_decreasing_fpr():
+    roc = plot.ROC(np.array([1.0, 0.5, 0.0]), np.array([1.0, 0.8, 0.0])).plot()
+
+    (text,) = [t.get_text() for t in roc.ax.get_legend().get_texts()]
+    assert text == "ROC curve (area = 0.65)"
+
+
+def test_roc_area_non_monotonic_fpr_error():
+    roc = plot.ROC(np.array([0.0, 0.6, 0.3, 1.0]), np.array([0.0, 0.5, 0.7, 1.0]))
+
+    with pytest.raises(ValueError, match="neither increasing nor decreasing"):
+        roc.plot()
+
+
+def test_fast_roc_non_binary_y_true_error():
+    with pytest.raises(ValueError) as e:
+        _fast_roc([0, 1, 2], [0.1, 0.5, 0.9])
+
+    assert "Expected binary y_true" in str(e.value)
+
+
+def test_roc_multi_draws_chance_line_once(roc_multi_classification_raw_data):
+    y_test, y_score = roc_multi_classification_raw_data
+    roc = plot.ROC.from_raw_data(y_test, y_score)
+    roc_add = roc + roc
+
+    n_curves = len(roc.fpr)
+    assert len(roc.ax.lines) == n_curves + 1
+    assert len(roc_add.ax_.lines) == 2 * n_curves + 1
+    assert len(roc_add.ax_.get_legend().get_texts()) == 2 * n_curves
+
+
+def test_roc_draws_chance_line_on_cleared_ax():
+    _, ax = plt.subplots()
+    plot.ROC(fpr, tpr).plot(ax=ax)
+    ax.cla()
+    plot.ROC(fpr, tpr).plot(ax=ax)
+
+    assert len(ax.lines) == 2
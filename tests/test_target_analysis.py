@@ -47,6 +47,29 @@ def test_invalid_target():
         plot.target_analysis(y_valid, y_invalid)
 
 
+def test_invalid_target_with_class_counts():
+    y_invalid = np.random.uniform(size=100)
+
+    with pytest.raises(TypeError):
+        plot.target_analysis(
+            y_invalid, class_counts=np.unique(y_invalid, return_counts=True)
+        )
+
+
+def test_balance_with_class_counts(target_analysis_multiclass):
+    _, _, y_train, _ = target_analysis_multiclass
+
+    ax = plot.target_analysis(y_train)
+    ax_counts = plot.target_analysis(
+        y_train, class_counts=np.unique(y_train, return_counts=True)
+    )
+
+    assert [p.get_height() for p in ax_counts.patches] == [
+        p.get_height() for p in ax.patches
+    ]
+    assert ax_counts.get_title() == ax.get_title()
+
+
 def test_class_names_must_match(target_analysis_binary, ploomber_value_error_message):
     """
     Assert error raised when more classes are in data than specified